@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import uuid
 from abc import ABC, abstractmethod
 from typing import Any
 
 from app.core.event_bus import EventBus
 from app.core.llm import LLMClient
-from app.domain.models import SwarmMessage
+from app.core.sharding import ShardLayout
+from app.domain.models import SwarmControlAction, SwarmMessage, SwarmMessageType
 
 
 logger = logging.getLogger(__name__)
 
 
+CANCELLED_MISSIONS_LIMIT = 10_000
+
+
 class BaseAgent(ABC):
     def __init__(
         self,
@@ -20,23 +26,210 @@ class BaseAgent(ABC):
         role: str,
         event_bus: EventBus,
         llm_client: LLMClient,
+        concurrency: int = 1,
+        shard_layout: ShardLayout | None = None,
+        shard_index: int = 0,
     ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
         self.agent_id = agent_id
         self.role = role
         self._event_bus = event_bus
         self._llm_client = llm_client
+        self._shard_layout = shard_layout if shard_layout is not None else ShardLayout()
+        if not 0 <= shard_index < self._shard_layout.count(role):
+            raise ValueError(
+                f"shard_index {shard_index} out of range for role {role!r} "
+                f"with {self._shard_layout.count(role)} shard(s)"
+            )
+        self.shard_index = shard_index
+        self._slots = asyncio.Semaphore(concurrency)
+        self._pending: asyncio.Queue[SwarmMessage] = asyncio.Queue()
+        self._listeners: list[asyncio.Task[None]] = []
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._in_flight_by_mission: dict[uuid.UUID, set[asyncio.Task[None]]] = {}
+        self._cancelled_missions: dict[uuid.UUID, None] = {}
 
     @property
     @abstractmethod
     def input_channels(self) -> list[str]:
         raise NotImplementedError
 
+    def own_channel(self, channel: str) -> str:
+        return self._shard_layout.shard_channel(channel, self.role, self.shard_index)
+
+    def route_channel(self, channel: str, role: str, mission_id: uuid.UUID) -> str:
+        return self._shard_layout.channel_for(channel, role, mission_id)
+
+    def is_cancelled(self, mission_id: uuid.UUID) -> bool:
+        return mission_id in self._cancelled_missions
+
     async def run(self) -> None:
-        await asyncio.gather(*(self._listen_channel(channel) for channel in self.input_channels))
+        self._listeners = [asyncio.create_task(self._listen_channel(channel)) for channel in self.input_channels]
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            # drain() cancels the listeners first, so wait for the dispatcher too instead of
+            # letting gather() stop everything at the first cancelled listener.
+            done, _ = await asyncio.wait([*self._listeners, self._dispatcher], return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                exception = None if task.cancelled() else task.exception()
+                if exception is not None:
+                    raise exception
+        finally:
+            for listener in self._listeners:
+                listener.cancel()
+            self._dispatcher.cancel()
+            in_flight = set(self._in_flight)
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def drain(self, timeout: float) -> None:
+        """Stop consuming new messages and wait up to ``timeout`` seconds for queued and in-flight handlers."""
+        for listener in self._listeners:
+            listener.cancel()
+        await asyncio.gather(*self._listeners, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        if not self._pending.empty() or self._in_flight:
+            logger.info(
+                "agent_draining",
+                extra={
+                    "agent_id": self.agent_id,
+                    "role": self.role,
+                    "queued": self._pending.qsize(),
+                    "in_flight": len(self._in_flight),
+                },
+            )
+        while (not self._pending.empty() or self._in_flight) and loop.time() < deadline:
+            if self._in_flight:
+                await asyncio.wait(
+                    set(self._in_flight),
+                    timeout=deadline - loop.time(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            else:
+                await asyncio.sleep(0.01)
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+        if not self._pending.empty():
+            logger.warning(
+                "agent_drain_dropped_queued",
+                extra={
+                    "agent_id": self.agent_id,
+                    "role": self.role,
+                    "dropped": self._pending.qsize(),
+                },
+            )
+        pending = set(self._in_flight)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if pending:
+            logger.warning(
+                "agent_drain_timeout",
+                extra={
+                    "agent_id": self.agent_id,
+                    "role": self.role,
+                    "cancelled": len(pending),
+                },
+            )
 
     async def _listen_channel(self, channel: str) -> None:
         async for message in self._event_bus.subscribe(channel):
+            if (
+                message.type == SwarmMessageType.CONTROL
+                and message.payload.get("action") == SwarmControlAction.CANCEL
+            ):
+                await self.cancel_mission(message)
+                continue
+            # Never block here: the listener must keep reading to see cancels for queued missions.
+            self._pending.put_nowait(message)
+
+    async def _dispatch(self) -> None:
+        while True:
+            await self._slots.acquire()
+            message = await self._pending.get()
+            if self.is_cancelled(message.mission_id):
+                self._slots.release()
+                logger.info(
+                    "message_skipped_cancelled",
+                    extra={
+                        "agent_id": self.agent_id,
+                        "mission_id": str(message.mission_id),
+                        "message_type": message.type,
+                    },
+                )
+                continue
+            task = asyncio.create_task(self._handle_in_slot(message))
+            self._in_flight.add(task)
+            mission_tasks = self._in_flight_by_mission.setdefault(message.mission_id, set())
+            mission_tasks.add(task)
+            # Done callbacks also run for tasks cancelled before their first step.
+            task.add_done_callback(self._release_slot)
+            task.add_done_callback(self._in_flight.discard)
+            task.add_done_callback(functools.partial(self._forget_in_flight, message.mission_id))
+
+    def _release_slot(self, task: asyncio.Task[None]) -> None:
+        self._slots.release()
+
+    def _forget_in_flight(self, mission_id: uuid.UUID, task: asyncio.Task[None]) -> None:
+        mission_tasks = self._in_flight_by_mission.get(mission_id)
+        if mission_tasks is None:
+            return
+        mission_tasks.discard(task)
+        if not mission_tasks:
+            del self._in_flight_by_mission[mission_id]
+
+    async def _handle_in_slot(self, message: SwarmMessage) -> None:
+        try:
             await self.handle_message(message)
+        except asyncio.CancelledError:
+            if self.is_cancelled(message.mission_id):
+                logger.info(
+                    "handler_cancelled",
+                    extra={
+                        "agent_id": self.agent_id,
+                        "mission_id": str(message.mission_id),
+                        "message_id": str(message.id),
+                    },
+                )
+            raise
+        except Exception:
+            logger.exception(
+                "agent_handler_failed",
+                extra={
+                    "agent_id": self.agent_id,
+                    "role": self.role,
+                    "message_id": str(message.id),
+                },
+            )
+
+    async def cancel_mission(self, message: SwarmMessage) -> None:
+        """Skip queued messages of the mission and cancel its in-flight handlers."""
+        mission_id = message.mission_id
+        if self.is_cancelled(mission_id):
+            return
+        self._cancelled_missions[mission_id] = None
+        if len(self._cancelled_missions) > CANCELLED_MISSIONS_LIMIT:
+            del self._cancelled_missions[next(iter(self._cancelled_missions))]
+        in_flight = self._in_flight_by_mission.get(mission_id, set())
+        for task in in_flight:
+            task.cancel()
+        logger.info(
+            "mission_cancelled",
+            extra={
+                "agent_id": self.agent_id,
+                "mission_id": str(mission_id),
+                "cancelled_handlers": len(in_flight),
+            },
+        )
+        await self.on_mission_cancelled(message)
+
+    async def on_mission_cancelled(self, message: SwarmMessage) -> None:
+        return None
 
     async def handle_message(self, message: SwarmMessage) -> None:
         logger.info(
@@ -62,4 +255,3 @@ class BaseAgent(ABC):
     async def call_llm(self, prompt: str) -> str:
         response = await self._llm_client.generate(prompt)
         return response
-
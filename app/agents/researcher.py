@@ -6,6 +6,7 @@ from typing import Any
 from app.agents.base import BaseAgent
 from app.core.event_bus import EventBus
 from app.core.llm import LLMClient
+from app.core.sharding import ShardLayout
 from app.core.search import SearchClient, SearchResult
 from app.domain.models import SwarmMessage, SwarmMessageType, Task, TaskStatus
 from app.agents.supervisor import TASK_RESULTS_CHANNEL, RESEARCHER_TASKS_CHANNEL
@@ -20,13 +21,24 @@ class ResearcherAgent(BaseAgent):
         event_bus: EventBus,
         llm_client: LLMClient,
         search_client: SearchClient,
+        concurrency: int = 1,
+        shard_layout: ShardLayout | None = None,
+        shard_index: int = 0,
     ) -> None:
-        super().__init__(agent_id=agent_id, role="researcher", event_bus=event_bus, llm_client=llm_client)
+        super().__init__(
+            agent_id=agent_id,
+            role="researcher",
+            event_bus=event_bus,
+            llm_client=llm_client,
+            concurrency=concurrency,
+            shard_layout=shard_layout,
+            shard_index=shard_index,
+        )
         self._search_client = search_client
 
     @property
     def input_channels(self) -> list[str]:
-        return [RESEARCHER_TASKS_CHANNEL]
+        return [self.own_channel(RESEARCHER_TASKS_CHANNEL)]
 
     async def think(self, message: SwarmMessage) -> Task | None:
         if message.type != SwarmMessageType.TASK_CREATED:
@@ -107,17 +119,18 @@ class ResearcherAgent(BaseAgent):
                     "error": str(e),
                 },
             )
+        results_channel = self.route_channel(TASK_RESULTS_CHANNEL, "supervisor", task.mission_id)
         result_message = SwarmMessage(
             mission_id=task.mission_id,
             task_id=task.id,
             source_agent=self.agent_id,
             target_agent="supervisor",
-            channel=TASK_RESULTS_CHANNEL,
+            channel=results_channel,
             type=SwarmMessageType.TASK_RESULT,
             payload=task.result if task.result else {"error": task.error},
             correlation_id=message.id,
         )
-        await self._event_bus.publish(channel=TASK_RESULTS_CHANNEL, message=result_message)
+        await self._event_bus.publish(channel=results_channel, message=result_message)
 
     async def _generate_search_query(self, goal: str) -> str:
         prompt = f"""Com base no objetivo abaixo, gere uma query de busca concisa e específica para encontrar informações relevantes.
@@ -3,12 +3,14 @@ from __future__ import annotations
 import logging
 import uuid
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any
 
 from app.agents.base import BaseAgent
+from app.core.blackboard import SharedBlackboard
 from app.core.event_bus import EventBus
 from app.core.llm import LLMClient
-from app.domain.models import SwarmMessage, SwarmMessageType, Task, TaskStatus
+from app.core.sharding import ShardLayout
+from app.domain.models import SwarmControlAction, SwarmMessage, SwarmMessageType, Task, TaskStatus
 
 
 logger = logging.getLogger(__name__)
@@ -20,17 +22,6 @@ RESEARCHER_TASKS_CHANNEL = "swarm:workers:researcher:tasks"
 CODER_TASKS_CHANNEL = "swarm:workers:coder:tasks"
 
 
-class SharedBlackboard(Protocol):
-    async def create_task(self, task: Task) -> None:
-        raise NotImplementedError
-
-    async def update_task(self, task: Task) -> None:
-        raise NotImplementedError
-
-    async def get_task(self, task_id: uuid.UUID) -> Task | None:
-        raise NotImplementedError
-
-
 @dataclass(slots=True)
 class SupervisorDecision:
     new_tasks: list[Task]
@@ -44,13 +35,24 @@ class SupervisorAgent(BaseAgent):
         event_bus: EventBus,
         llm_client: LLMClient,
         blackboard: SharedBlackboard,
+        concurrency: int = 1,
+        shard_layout: ShardLayout | None = None,
+        shard_index: int = 0,
     ) -> None:
-        super().__init__(agent_id=agent_id, role="supervisor", event_bus=event_bus, llm_client=llm_client)
+        super().__init__(
+            agent_id=agent_id,
+            role="supervisor",
+            event_bus=event_bus,
+            llm_client=llm_client,
+            concurrency=concurrency,
+            shard_layout=shard_layout,
+            shard_index=shard_index,
+        )
         self._blackboard = blackboard
 
     @property
     def input_channels(self) -> list[str]:
-        return [SUPERVISOR_CONTROL_CHANNEL, TASK_RESULTS_CHANNEL]
+        return [self.own_channel(SUPERVISOR_CONTROL_CHANNEL), self.own_channel(TASK_RESULTS_CHANNEL)]
 
     async def think(self, message: SwarmMessage) -> SupervisorDecision:
         if message.type == SwarmMessageType.MISSION_CREATED:
@@ -86,7 +88,7 @@ class SupervisorAgent(BaseAgent):
             return decision
         if message.type == SwarmMessageType.TASK_RESULT and message.task_id is not None:
             task = await self._blackboard.get_task(message.task_id)
-            if task is None:
+            if task is None or task.status == TaskStatus.CANCELLED:
                 decision = SupervisorDecision(new_tasks=[])
                 return decision
             task.status = TaskStatus.COMPLETED
@@ -101,12 +103,7 @@ class SupervisorAgent(BaseAgent):
         if not isinstance(thought, SupervisorDecision):
             return
         for task in thought.new_tasks:
-            if task.assigned_agent == "researcher":
-                channel = RESEARCHER_TASKS_CHANNEL
-            elif task.assigned_agent == "coder":
-                channel = CODER_TASKS_CHANNEL
-            else:
-                channel = SUPERVISOR_CONTROL_CHANNEL
+            channel = self._task_channel(task.assigned_agent, task.mission_id)
             swarm_message = SwarmMessage(
                 mission_id=task.mission_id,
                 task_id=task.id,
@@ -127,3 +124,35 @@ class SupervisorAgent(BaseAgent):
                 },
             )
 
+    async def on_mission_cancelled(self, message: SwarmMessage) -> None:
+        tasks = await self._blackboard.list_tasks(message.mission_id)
+        open_statuses = (TaskStatus.PENDING, TaskStatus.RUNNING)
+        children = [task for task in tasks if task.parent_id is not None]
+        open_children = [task for task in children if task.status in open_statuses]
+        if children and not open_children:
+            return
+        worker_channels: set[str] = set()
+        for task in tasks:
+            if task.status not in open_statuses:
+                continue
+            if task.assigned_agent in ("researcher", "coder"):
+                worker_channels.add(self._task_channel(task.assigned_agent, task.mission_id))
+            task.status = TaskStatus.CANCELLED
+            await self._blackboard.update_task(task)
+        for channel in sorted(worker_channels):
+            cancel_message = SwarmMessage(
+                mission_id=message.mission_id,
+                source_agent=self.agent_id,
+                channel=channel,
+                type=SwarmMessageType.CONTROL,
+                payload={"action": SwarmControlAction.CANCEL},
+                correlation_id=message.id,
+            )
+            await self._event_bus.publish(channel=channel, message=cancel_message)
+
+    def _task_channel(self, assigned_agent: str | None, mission_id: uuid.UUID) -> str:
+        if assigned_agent == "researcher":
+            return self.route_channel(RESEARCHER_TASKS_CHANNEL, "researcher", mission_id)
+        if assigned_agent == "coder":
+            return self.route_channel(CODER_TASKS_CHANNEL, "coder", mission_id)
+        return self.route_channel(SUPERVISOR_CONTROL_CHANNEL, "supervisor", mission_id)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import uuid
+from typing import Protocol
+
+from app.domain.models import Task
+
+
+class SharedBlackboard(Protocol):
+    async def create_task(self, task: Task) -> None:
+        raise NotImplementedError
+
+    async def update_task(self, task: Task) -> None:
+        raise NotImplementedError
+
+    async def get_task(self, task_id: uuid.UUID) -> Task | None:
+        raise NotImplementedError
+
+    async def list_tasks(self, mission_id: uuid.UUID) -> list[Task]:
+        raise NotImplementedError
+
+
+class InMemoryBlackboard(SharedBlackboard):
+    def __init__(self) -> None:
+        self._tasks: dict[uuid.UUID, Task] = {}
+
+    async def create_task(self, task: Task) -> None:
+        self._tasks[task.id] = task
+
+    async def update_task(self, task: Task) -> None:
+        self._tasks[task.id] = task
+
+    async def get_task(self, task_id: uuid.UUID) -> Task | None:
+        return self._tasks.get(task_id)
+
+    async def list_tasks(self, mission_id: uuid.UUID) -> list[Task]:
+        return [task for task in self._tasks.values() if task.mission_id == mission_id]
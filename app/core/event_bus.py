@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
@@ -27,8 +28,10 @@ class EventBus(ABC):
 
 
 class RedisEventBus(EventBus):
-    def __init__(self, redis_url: str) -> None:
-        self._redis = Redis.from_url(redis_url, encoding="utf-8", decode_responses=True)
+    def __init__(self, redis_url: str, redis: Redis | None = None) -> None:
+        if redis is None:
+            redis = Redis.from_url(redis_url, encoding="utf-8", decode_responses=True)
+        self._redis = redis
 
     async def publish(self, channel: str, message: SwarmMessage) -> None:
         payload = message.model_dump_json()
@@ -51,6 +54,47 @@ class RedisEventBus(EventBus):
             await pubsub.unsubscribe(channel)
             await pubsub.close()
 
+    async def subscriber_count(self, channel: str) -> int:
+        counts = await self._redis.pubsub_numsub(channel)
+        return int(counts[0][1]) if counts else 0
+
     async def close(self) -> None:
         await self._redis.close()
 
+
+class InMemoryEventBus(EventBus):
+    """In-process fan-out bus with Redis Pub/Sub delivery semantics.
+
+    Messages are round-tripped through JSON so subscribers never share payloads.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[asyncio.Queue[str | None]]] = {}
+
+    async def subscriber_count(self, channel: str) -> int:
+        return len(self._subscribers.get(channel, ()))
+
+    async def publish(self, channel: str, message: SwarmMessage) -> None:
+        payload = message.model_dump_json()
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(payload)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[SwarmMessage]:
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        subscribers = self._subscribers.setdefault(channel, set())
+        subscribers.add(queue)
+        try:
+            while True:
+                data = await queue.get()
+                if data is None:
+                    return
+                message = SwarmMessage.model_validate_json(data)
+                yield message
+        finally:
+            subscribers.discard(queue)
+
+    async def close(self) -> None:
+        for subscribers in self._subscribers.values():
+            for queue in subscribers:
+                queue.put_nowait(None)
+        self._subscribers.clear()
@@ -3,8 +3,6 @@ from __future__ import annotations
 import logging
 from typing import Protocol
 
-from openai import AsyncOpenAI
-
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,10 @@ class LLMClient(Protocol):
 
 class OpenAILLMClient:
     def __init__(self, api_key: str, model: str) -> None:
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise ImportError("openai não está instalado. Instale com: pip install openai")
         self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Protocol
 
@@ -24,23 +23,19 @@ class SearchClient(Protocol):
 class TavilySearchClient:
     def __init__(self, api_key: str) -> None:
         try:
-            from tavily import TavilyClient
+            from tavily import AsyncTavilyClient
         except ImportError:
             raise ImportError(
-                "tavily-python não está instalado. Instale com: pip install tavily-python"
+                "tavily-python>=0.5.0 não está instalado. Instale com: pip install tavily-python"
             )
-        self._client = TavilyClient(api_key=api_key)
+        self._client = AsyncTavilyClient(api_key=api_key)
 
     async def search(self, query: str, max_results: int = 5) -> list[SearchResult]:
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._client.search(
-                    query=query,
-                    max_results=max_results,
-                    search_depth="advanced",
-                ),
+            response = await self._client.search(
+                query=query,
+                max_results=max_results,
+                search_depth="advanced",
             )
             results = []
             for result in response.get("results", []):
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+import uuid
+from dataclasses import dataclass, field
+
+
+SHARDED_ROLES = ("supervisor", "researcher", "coder")
+
+
+@dataclass(slots=True, frozen=True)
+class ShardLayout:
+    """Number of shards per agent role.
+
+    Messages are routed to ``<channel>:<shard>`` with the shard chosen by
+    ``mission_id`` hash, so every message of a mission reaches the same process.
+    Roles with a single shard keep the plain channel name.
+    """
+
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, spec: str) -> ShardLayout:
+        counts: dict[str, int] = {}
+        for entry in filter(None, (part.strip() for part in spec.split(","))):
+            role, sep, raw_count = entry.partition("=")
+            role = role.strip()
+            if not sep or not role:
+                raise ValueError(f"Invalid shard entry {entry!r}, expected role=count")
+            if role not in SHARDED_ROLES:
+                raise ValueError(f"Unknown role {role!r} in shard entry (known: {', '.join(SHARDED_ROLES)})")
+            try:
+                count = int(raw_count)
+            except ValueError:
+                raise ValueError(f"Invalid shard count in {entry!r}, expected an integer")
+            if count < 1:
+                raise ValueError(f"Shard count for {role!r} must be at least 1")
+            counts[role] = count
+        return cls(counts=counts)
+
+    @classmethod
+    def from_env(cls) -> ShardLayout:
+        return cls.parse(os.getenv("SWARM_SHARDS", ""))
+
+    def count(self, role: str) -> int:
+        return self.counts.get(role, 1)
+
+    def shard_for(self, role: str, mission_id: uuid.UUID) -> int:
+        return mission_id.int % self.count(role)
+
+    def channel_for(self, channel: str, role: str, mission_id: uuid.UUID) -> str:
+        return self.shard_channel(channel, role, self.shard_for(role, mission_id))
+
+    def shard_channel(self, channel: str, role: str, shard_index: int) -> str:
+        if self.count(role) == 1:
+            return channel
+        return f"{channel}:{shard_index}"
@@ -32,6 +32,10 @@ class SwarmMessageType(StrEnum):
     CONTROL = "CONTROL"
 
 
+class SwarmControlAction(StrEnum):
+    CANCEL = "CANCEL"
+
+
 class Task(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     mission_id: uuid.UUID
@@ -8,34 +8,23 @@ from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from fastapi import FastAPI
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from app.agents.base import BaseAgent
 from app.agents.researcher import ResearcherAgent
-from app.agents.supervisor import SUPERVISOR_CONTROL_CHANNEL, SharedBlackboard, SupervisorAgent
+from app.agents.supervisor import SUPERVISOR_CONTROL_CHANNEL, SupervisorAgent
+from app.core.blackboard import InMemoryBlackboard, SharedBlackboard
 from app.core.event_bus import EventBus, RedisEventBus
 from app.core.llm import OpenAILLMClient
 from app.core.search import TavilySearchClient
-from app.domain.models import SwarmMessage, SwarmMessageType, Task
+from app.core.sharding import ShardLayout
+from app.domain.models import SwarmControlAction, SwarmMessage, SwarmMessageType
 
 
 logger = logging.getLogger("agents-swarm")
 logging.basicConfig(level=logging.INFO)
 
 
-class InMemoryBlackboard(SharedBlackboard):
-    def __init__(self) -> None:
-        self._tasks: dict[uuid.UUID, Task] = {}
-
-    async def create_task(self, task: Task) -> None:
-        self._tasks[task.id] = task
-
-    async def update_task(self, task: Task) -> None:
-        self._tasks[task.id] = task
-
-    async def get_task(self, task_id: uuid.UUID) -> Task | None:
-        return self._tasks.get(task_id)
-
-
 class MissionRequest(BaseModel):
     goal: str
 
@@ -45,62 +34,75 @@ class MissionResponse(BaseModel):
 
 
 class AppState(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     event_bus: EventBus
-    supervisor: SupervisorAgent
-    researcher: ResearcherAgent | None = None
+    shard_layout: ShardLayout
+    agents: list[BaseAgent] = []
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+def create_embedded_agents(event_bus: EventBus, shard_layout: ShardLayout) -> list[BaseAgent]:
     openai_api_key = os.getenv("OPENAI_API_KEY", "")
     openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     tavily_api_key = os.getenv("TAVILY_API_KEY", "")
 
-    event_bus = RedisEventBus(redis_url=redis_url)
     llm_client = OpenAILLMClient(api_key=openai_api_key, model=openai_model)
     search_client = TavilySearchClient(api_key=tavily_api_key) if tavily_api_key else None
 
     blackboard: SharedBlackboard = InMemoryBlackboard()
-    supervisor = SupervisorAgent(
-        agent_id="supervisor-1",
-        event_bus=event_bus,
-        llm_client=llm_client,
-        blackboard=blackboard,
-    )
+    agents: list[BaseAgent] = [
+        SupervisorAgent(
+            agent_id=f"supervisor-{shard_index + 1}",
+            event_bus=event_bus,
+            llm_client=llm_client,
+            blackboard=blackboard,
+            shard_layout=shard_layout,
+            shard_index=shard_index,
+        )
+        for shard_index in range(shard_layout.count("supervisor"))
+    ]
 
     if search_client is None:
         logger.warning("TAVILY_API_KEY não configurada. ResearcherAgent não será iniciado.")
-        researcher = None
     else:
-        researcher = ResearcherAgent(
-            agent_id="researcher-1",
-            event_bus=event_bus,
-            llm_client=llm_client,
-            search_client=search_client,
+        agents.extend(
+            ResearcherAgent(
+                agent_id=f"researcher-{shard_index + 1}",
+                event_bus=event_bus,
+                llm_client=llm_client,
+                search_client=search_client,
+                shard_layout=shard_layout,
+                shard_index=shard_index,
+            )
+            for shard_index in range(shard_layout.count("researcher"))
         )
+    return agents
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    embedded_agents = os.getenv("SWARM_EMBEDDED_AGENTS", "true").lower() not in {"0", "false", "no"}
+
+    event_bus = RedisEventBus(redis_url=redis_url)
+    shard_layout = ShardLayout.from_env()
+    agents = create_embedded_agents(event_bus, shard_layout) if embedded_agents else []
+    if not embedded_agents:
+        logger.info("SWARM_EMBEDDED_AGENTS desativado. Agentes devem rodar via `python -m app.worker`.")
 
     app.state.app_state = AppState(
         event_bus=event_bus,
-        supervisor=supervisor,
-        researcher=researcher if researcher is not None else None,
+        shard_layout=shard_layout,
+        agents=agents,
     )
 
-    async def start_agents() -> None:
-        tasks = [asyncio.create_task(supervisor.run())]
-        if researcher is not None:
-            tasks.append(asyncio.create_task(researcher.run()))
-        await asyncio.gather(*tasks)
-
-    agents_task = asyncio.create_task(start_agents())
+    agent_tasks = [asyncio.create_task(agent.run()) for agent in agents]
     try:
         yield
     finally:
-        agents_task.cancel()
-        try:
-            await agents_task
-        except asyncio.CancelledError:
-            pass
+        for agent_task in agent_tasks:
+            agent_task.cancel()
+        await asyncio.gather(*agent_tasks, return_exceptions=True)
         await event_bus.close()
 
 
@@ -111,16 +113,17 @@ app = FastAPI(lifespan=lifespan)
 async def create_mission(request: MissionRequest) -> MissionResponse:
     mission_id = uuid.uuid4()
     app_state: AppState = app.state.app_state
+    channel = app_state.shard_layout.channel_for(SUPERVISOR_CONTROL_CHANNEL, "supervisor", mission_id)
     message = SwarmMessage(
         mission_id=mission_id,
         task_id=None,
         source_agent=None,
         target_agent="supervisor",
-        channel=SUPERVISOR_CONTROL_CHANNEL,
+        channel=channel,
         type=SwarmMessageType.MISSION_CREATED,
         payload={"goal": request.goal},
     )
-    await app_state.event_bus.publish(channel=SUPERVISOR_CONTROL_CHANNEL, message=message)
+    await app_state.event_bus.publish(channel=channel, message=message)
     logger.info(
         "mission_created",
         extra={
@@ -131,3 +134,26 @@ async def create_mission(request: MissionRequest) -> MissionResponse:
     response = MissionResponse(mission_id=mission_id)
     return response
 
+
+@app.delete("/missions/{mission_id}", response_model=MissionResponse, status_code=202)
+async def cancel_mission(mission_id: uuid.UUID) -> MissionResponse:
+    app_state: AppState = app.state.app_state
+    channel = app_state.shard_layout.channel_for(SUPERVISOR_CONTROL_CHANNEL, "supervisor", mission_id)
+    message = SwarmMessage(
+        mission_id=mission_id,
+        task_id=None,
+        source_agent=None,
+        target_agent="supervisor",
+        channel=channel,
+        type=SwarmMessageType.CONTROL,
+        payload={"action": SwarmControlAction.CANCEL},
+    )
+    await app_state.event_bus.publish(channel=channel, message=message)
+    logger.info(
+        "mission_cancel_requested",
+        extra={
+            "mission_id": str(mission_id),
+        },
+    )
+    response = MissionResponse(mission_id=mission_id)
+    return response
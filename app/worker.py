@@ -0,0 +1,231 @@
+"""Standalone worker runner: starts selected agent roles outside the API process.
+
+Each role is started with one process per shard (see ``SWARM_SHARDS``), and each
+process handles up to ``--concurrency`` messages at a time::
+
+    SWARM_SHARDS="supervisor=2,researcher=4" python -m app.worker --roles supervisor,researcher --concurrency researcher=8
+
+On SIGTERM/SIGINT every process stops consuming, waits for in-flight handlers for
+up to ``--drain-timeout`` seconds and exits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+
+from app.agents.base import BaseAgent
+from app.agents.researcher import ResearcherAgent
+from app.agents.supervisor import SupervisorAgent
+from app.core.blackboard import InMemoryBlackboard
+from app.core.event_bus import EventBus, RedisEventBus
+from app.core.llm import OpenAILLMClient
+from app.core.search import TavilySearchClient
+from app.core.sharding import ShardLayout
+
+
+logger = logging.getLogger("agents-swarm.worker")
+
+ROLES = ("supervisor", "researcher")
+
+
+@dataclass(slots=True, frozen=True)
+class WorkerSpec:
+    role: str
+    shard_index: int
+    shard_layout: ShardLayout
+    concurrency: int
+    drain_timeout: float
+
+    @property
+    def name(self) -> str:
+        return f"{self.role}-{self.shard_index}"
+
+
+def create_agent(spec: WorkerSpec, event_bus: EventBus) -> BaseAgent:
+    llm_client = OpenAILLMClient(
+        api_key=os.getenv("OPENAI_API_KEY", ""),
+        model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+    )
+    if spec.role == "supervisor":
+        return SupervisorAgent(
+            agent_id=spec.name,
+            event_bus=event_bus,
+            llm_client=llm_client,
+            blackboard=InMemoryBlackboard(),
+            concurrency=spec.concurrency,
+            shard_layout=spec.shard_layout,
+            shard_index=spec.shard_index,
+        )
+    if spec.role == "researcher":
+        tavily_api_key = os.getenv("TAVILY_API_KEY", "")
+        if not tavily_api_key:
+            raise ValueError("TAVILY_API_KEY não configurada. ResearcherAgent não pode ser iniciado.")
+        return ResearcherAgent(
+            agent_id=spec.name,
+            event_bus=event_bus,
+            llm_client=llm_client,
+            search_client=TavilySearchClient(api_key=tavily_api_key),
+            concurrency=spec.concurrency,
+            shard_layout=spec.shard_layout,
+            shard_index=spec.shard_index,
+        )
+    raise ValueError(f"Unknown role: {spec.role!r}")
+
+
+async def serve(spec: WorkerSpec) -> None:
+    event_bus = RedisEventBus(redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    agent = create_agent(spec, event_bus)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+
+    run_task = asyncio.create_task(agent.run())
+    stop_task = asyncio.create_task(stop.wait())
+    logger.info(
+        "worker_started",
+        extra={
+            "agent_id": agent.agent_id,
+            "role": spec.role,
+            "channels": agent.input_channels,
+            "concurrency": spec.concurrency,
+        },
+    )
+    try:
+        await asyncio.wait({run_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        if run_task.done():
+            run_task.result()
+        logger.info("worker_draining", extra={"agent_id": agent.agent_id, "role": spec.role})
+        await agent.drain(timeout=spec.drain_timeout)
+    finally:
+        stop_task.cancel()
+        run_task.cancel()
+        await asyncio.gather(run_task, stop_task, return_exceptions=True)
+        await event_bus.close()
+    logger.info("worker_stopped", extra={"agent_id": agent.agent_id, "role": spec.role})
+
+
+def _run_process(spec: WorkerSpec) -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve(spec))
+
+
+def _parse_concurrency(spec: str, roles: list[str]) -> dict[str, int]:
+    default = 1
+    overrides: dict[str, int] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        role, sep, raw_value = entry.rpartition("=")
+        role = role.strip()
+        try:
+            value = int(raw_value)
+        except ValueError:
+            raise ValueError(f"Invalid concurrency entry {entry!r}, expected N or role=N")
+        if value < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {entry!r}")
+        if not sep:
+            default = value
+        elif role in ROLES:
+            overrides[role] = value
+        else:
+            raise ValueError(f"Unknown role {role!r} in concurrency entry (available: {', '.join(ROLES)})")
+    return {role: overrides.get(role, default) for role in roles}
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--roles", default=",".join(ROLES), help="Comma-separated roles to start.")
+    parser.add_argument(
+        "--shards",
+        default=os.getenv("SWARM_SHARDS", ""),
+        help="Processes per role, e.g. supervisor=2,researcher=4 (default: $SWARM_SHARDS). "
+        "The API and every worker must use the same value.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        default=os.getenv("SWARM_CONCURRENCY", "1"),
+        help="Handlers in flight per process: a number for every role or role=N entries.",
+    )
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+    args.roles = [role.strip() for role in args.roles.split(",") if role.strip()]
+    unknown = sorted(set(args.roles) - set(ROLES))
+    if unknown or not args.roles:
+        parser.error(f"unknown or missing roles {unknown} (available: {', '.join(ROLES)})")
+    try:
+        args.shards = ShardLayout.parse(args.shards)
+        args.concurrency = _parse_concurrency(args.concurrency, args.roles)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args(argv)
+    specs = [
+        WorkerSpec(
+            role=role,
+            shard_index=shard_index,
+            shard_layout=args.shards,
+            concurrency=args.concurrency[role],
+            drain_timeout=args.drain_timeout,
+        )
+        for role in args.roles
+        for shard_index in range(args.shards.count(role))
+    ]
+
+    stopping = False
+
+    def request_stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    context = multiprocessing.get_context("spawn")
+    processes: list[BaseProcess] = []
+    for spec in specs:
+        process: BaseProcess = context.Process(target=_run_process, args=(spec,), name=spec.name)
+        process.start()
+        processes.append(process)
+
+    exit_code = 0
+    while not stopping:
+        wait([process.sentinel for process in processes], timeout=0.5)
+        exited = [process for process in processes if not process.is_alive()]
+        if exited and not stopping:
+            for process in exited:
+                logger.error(
+                    "worker_process_exited",
+                    extra={
+                        "worker": process.name,
+                        "exit_code": process.exitcode,
+                    },
+                )
+            exit_code = 1
+            stopping = True
+
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join(timeout=args.drain_timeout + 5.0)
+        if process.is_alive():
+            logger.error("worker_process_killed", extra={"worker": process.name})
+            process.kill()
+            process.join()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
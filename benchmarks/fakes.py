@@ -0,0 +1,102 @@
+"""Deterministic stand-ins for the LLM and search providers."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+from dataclasses import dataclass
+
+from app.core.search import SearchResult
+
+
+class FakeClientError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class LatencyDistribution:
+    kind: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyDistribution:
+        """Parse ``kind:param[:param]`` with values in seconds.
+
+        Supported kinds: ``constant:s``, ``uniform:low:high``, ``normal:mean:stddev``,
+        ``lognormal:median:sigma`` and ``exponential:mean``.
+        """
+        kind, _, raw_params = spec.partition(":")
+        arity = {"constant": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+        if kind not in arity:
+            raise ValueError(f"Unknown latency distribution: {kind!r}")
+        try:
+            params = tuple(float(p) for p in raw_params.split(":")) if raw_params else ()
+        except ValueError:
+            raise ValueError(f"Invalid latency distribution parameters: {spec!r}")
+        if len(params) != arity[kind]:
+            raise ValueError(f"{kind} expects {arity[kind]} parameter(s), got {spec!r}")
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(self.params[0], self.params[1])
+        elif self.kind == "normal":
+            value = rng.gauss(self.params[0], self.params[1])
+        elif self.kind == "lognormal":
+            median, sigma = self.params
+            value = median * rng.lognormvariate(0.0, sigma)
+        else:
+            value = rng.expovariate(1.0 / self.params[0]) if self.params[0] > 0 else 0.0
+        return max(value, 0.0)
+
+    def __str__(self) -> str:
+        return ":".join([self.kind, *(f"{p:g}" for p in self.params)])
+
+
+class _FakeClient:
+    def __init__(self, latency: LatencyDistribution, error_rate: float, seed: int) -> None:
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self._latency = latency
+        self._error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+
+    async def _simulate(self, operation: str) -> None:
+        self.calls += 1
+        delay = self._latency.sample(self._rng)
+        fail = self._rng.random() < self._error_rate
+        await asyncio.sleep(delay)
+        if fail:
+            self.errors += 1
+            raise FakeClientError(f"injected {operation} failure")
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+class FakeLLMClient(_FakeClient):
+    async def generate(self, prompt: str) -> str:
+        await self._simulate("llm")
+        return f"fake-completion-{_digest(prompt)}"
+
+
+class FakeSearchClient(_FakeClient):
+    async def search(self, query: str, max_results: int = 5) -> list[SearchResult]:
+        await self._simulate("search")
+        digest = _digest(query)
+        results = [
+            SearchResult(
+                title=f"Result {i + 1} for {digest}",
+                url=f"https://example.com/{digest}/{i + 1}",
+                content=f"Deterministic content {i + 1} for query {digest}. " * 20,
+                score=1.0 - i / max(max_results, 1),
+            )
+            for i in range(max_results)
+        ]
+        return results
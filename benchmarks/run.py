@@ -0,0 +1,436 @@
+"""Run the supervisor/researcher pipeline offline and report throughput and latency.
+
+Usage::
+
+    python -m benchmarks.run --missions 500 --concurrency 50 --output bench.json
+    python -m benchmarks.run --baseline bench.json --max-regression 0.10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import math
+import os
+import platform
+import resource
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from app.agents.researcher import ResearcherAgent
+from app.agents.supervisor import (
+    RESEARCHER_TASKS_CHANNEL,
+    SUPERVISOR_CONTROL_CHANNEL,
+    TASK_RESULTS_CHANNEL,
+    SharedBlackboard,
+    SupervisorAgent,
+)
+from app.core.event_bus import EventBus, InMemoryEventBus, RedisEventBus
+from app.domain.models import SwarmMessage, SwarmMessageType, Task
+from benchmarks.fakes import FakeLLMClient, FakeSearchClient, LatencyDistribution
+
+
+logger = logging.getLogger("agents-swarm.benchmarks")
+
+BUS_KINDS = ("memory", "fakeredis", "redis")
+TRACKED_ROLES = frozenset({"researcher"})
+SCHEMA_VERSION = 1
+
+
+@dataclass(slots=True)
+class BenchmarkConfig:
+    missions: int
+    warmup: int
+    concurrency: int
+    agent_concurrency: int
+    mission_timeout: float
+    llm_latency: LatencyDistribution
+    llm_error_rate: float
+    search_latency: LatencyDistribution
+    search_error_rate: float
+    seed: int
+    redis_url: str
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    bus: str
+    missions: int
+    succeeded: int
+    failed: int
+    timed_out: int
+    failure_rate: float
+    timeout_rate: float
+    duration_s: float
+    missions_per_sec: float
+    latency_ms: dict[str, float]
+    messages_per_mission: float
+    messages_by_type: dict[str, int]
+    memory: dict[str, int]
+    llm_calls: int
+    search_calls: int
+
+
+class MissionTracker(SharedBlackboard):
+    """Blackboard that resolves a future once every tracked task of a mission has a result."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[uuid.UUID, Task] = {}
+        self._pending: dict[uuid.UUID, set[uuid.UUID]] = {}
+        self._failed: set[uuid.UUID] = set()
+        self._waiters: dict[uuid.UUID, asyncio.Future[bool]] = {}
+
+    def expect(self, mission_id: uuid.UUID) -> asyncio.Future[bool]:
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._waiters[mission_id] = waiter
+        return waiter
+
+    def forget(self, mission_id: uuid.UUID) -> None:
+        self._waiters.pop(mission_id, None)
+        self._pending.pop(mission_id, None)
+        self._failed.discard(mission_id)
+        for task_id in [t.id for t in self._tasks.values() if t.mission_id == mission_id]:
+            del self._tasks[task_id]
+
+    async def create_task(self, task: Task) -> None:
+        self._tasks[task.id] = task
+        if task.assigned_agent in TRACKED_ROLES:
+            self._pending.setdefault(task.mission_id, set()).add(task.id)
+
+    async def update_task(self, task: Task) -> None:
+        self._tasks[task.id] = task
+        pending = self._pending.get(task.mission_id)
+        if pending is None or task.id not in pending:
+            return
+        pending.discard(task.id)
+        if task.error is not None or (task.result is not None and "error" in task.result):
+            self._failed.add(task.mission_id)
+        if pending:
+            return
+        waiter = self._waiters.get(task.mission_id)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(task.mission_id not in self._failed)
+
+    async def get_task(self, task_id: uuid.UUID) -> Task | None:
+        return self._tasks.get(task_id)
+
+    async def list_tasks(self, mission_id: uuid.UUID) -> list[Task]:
+        return [task for task in self._tasks.values() if task.mission_id == mission_id]
+
+
+class CountingEventBus(EventBus):
+    def __init__(self, inner: EventBus) -> None:
+        self._inner = inner
+        self.by_mission: Counter[uuid.UUID] = Counter()
+        self.by_type: Counter[str] = Counter()
+
+    async def publish(self, channel: str, message: SwarmMessage) -> None:
+        self.by_mission[message.mission_id] += 1
+        self.by_type[message.type] += 1
+        await self._inner.publish(channel=channel, message=message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[SwarmMessage]:
+        async for message in self._inner.subscribe(channel):
+            yield message
+
+    async def close(self) -> None:
+        await self._inner.close()
+
+
+def _build_bus(kind: str, redis_url: str) -> InMemoryEventBus | RedisEventBus:
+    if kind == "memory":
+        return InMemoryEventBus()
+    if kind == "fakeredis":
+        try:
+            from fakeredis import FakeAsyncRedis
+        except ImportError:
+            raise ImportError("fakeredis não está instalado. Instale com: pip install -e \".[bench]\"")
+        return RedisEventBus(redis_url=redis_url, redis=FakeAsyncRedis(decode_responses=True))
+    return RedisEventBus(redis_url=redis_url)
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def _wait_for_subscribers(bus: InMemoryEventBus | RedisEventBus, channels: list[str]) -> None:
+    deadline = time.monotonic() + 10.0
+    while True:
+        counts = [await bus.subscriber_count(channel) for channel in channels]
+        if all(counts):
+            return
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Agents did not subscribe in time: {dict(zip(channels, counts))}")
+        await asyncio.sleep(0.01)
+
+
+async def run_benchmark(bus_kind: str, config: BenchmarkConfig) -> BenchmarkResult:
+    inner_bus = _build_bus(bus_kind, config.redis_url)
+    event_bus = CountingEventBus(inner_bus)
+    tracker = MissionTracker()
+    llm_client = FakeLLMClient(config.llm_latency, config.llm_error_rate, seed=config.seed)
+    search_client = FakeSearchClient(config.search_latency, config.search_error_rate, seed=config.seed + 1)
+    supervisor = SupervisorAgent(
+        agent_id="supervisor-bench",
+        event_bus=event_bus,
+        llm_client=llm_client,
+        blackboard=tracker,
+        concurrency=config.agent_concurrency,
+    )
+    researcher = ResearcherAgent(
+        agent_id="researcher-bench",
+        event_bus=event_bus,
+        llm_client=llm_client,
+        search_client=search_client,
+        concurrency=config.agent_concurrency,
+    )
+    agent_tasks = [asyncio.create_task(supervisor.run()), asyncio.create_task(researcher.run())]
+    semaphore = asyncio.Semaphore(config.concurrency)
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+
+    async def run_mission(index: int, measured: bool) -> None:
+        async with semaphore:
+            mission_id = uuid.uuid4()
+            waiter = tracker.expect(mission_id)
+            message = SwarmMessage(
+                mission_id=mission_id,
+                target_agent="supervisor",
+                channel=SUPERVISOR_CONTROL_CHANNEL,
+                type=SwarmMessageType.MISSION_CREATED,
+                payload={"goal": f"Benchmark mission {index}"},
+            )
+            started = time.perf_counter()
+            await event_bus.publish(channel=SUPERVISOR_CONTROL_CHANNEL, message=message)
+            try:
+                succeeded = await asyncio.wait_for(waiter, timeout=config.mission_timeout)
+                outcome = "succeeded" if succeeded else "failed"
+            except asyncio.TimeoutError:
+                outcome = "timed_out"
+            elapsed = time.perf_counter() - started
+            tracker.forget(mission_id)
+            if measured:
+                outcomes[outcome] += 1
+                if outcome != "timed_out":
+                    latencies.append(elapsed)
+
+    try:
+        await _wait_for_subscribers(
+            inner_bus, [SUPERVISOR_CONTROL_CHANNEL, TASK_RESULTS_CHANNEL, RESEARCHER_TASKS_CHANNEL]
+        )
+        await asyncio.gather(*(run_mission(i, measured=False) for i in range(config.warmup)))
+        event_bus.by_mission.clear()
+        event_bus.by_type.clear()
+        llm_calls_before, search_calls_before = llm_client.calls, search_client.calls
+        gc.collect()
+        rss_start = _rss_bytes()
+        started = time.perf_counter()
+        await asyncio.gather(*(run_mission(i, measured=True) for i in range(config.missions)))
+        duration = time.perf_counter() - started
+        gc.collect()
+        rss_end = _rss_bytes()
+    finally:
+        for task in agent_tasks:
+            task.cancel()
+        await asyncio.gather(*agent_tasks, return_exceptions=True)
+        await event_bus.close()
+
+    latencies.sort()
+    completed = outcomes["succeeded"] + outcomes["failed"]
+    result = BenchmarkResult(
+        bus=bus_kind,
+        missions=config.missions,
+        succeeded=outcomes["succeeded"],
+        failed=outcomes["failed"],
+        timed_out=outcomes["timed_out"],
+        failure_rate=round(outcomes["failed"] / max(config.missions, 1), 4),
+        timeout_rate=round(outcomes["timed_out"] / max(config.missions, 1), 4),
+        duration_s=round(duration, 4),
+        missions_per_sec=round(completed / duration, 3) if duration > 0 else 0.0,
+        latency_ms={
+            "p50": round(_percentile(latencies, 50) * 1000, 3),
+            "p95": round(_percentile(latencies, 95) * 1000, 3),
+            "p99": round(_percentile(latencies, 99) * 1000, 3),
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        },
+        messages_per_mission=round(sum(event_bus.by_mission.values()) / max(config.missions, 1), 3),
+        messages_by_type=dict(sorted(event_bus.by_type.items())),
+        memory={
+            "rss_start_bytes": rss_start,
+            "rss_end_bytes": rss_end,
+            "rss_growth_bytes": rss_end - rss_start,
+            "rss_growth_per_mission_bytes": (rss_end - rss_start) // max(config.missions, 1),
+        },
+        llm_calls=llm_client.calls - llm_calls_before,
+        search_calls=search_client.calls - search_calls_before,
+    )
+    return result
+
+
+# (metric path, True when higher is better)
+REGRESSION_METRICS: list[tuple[tuple[str, ...], bool]] = [
+    (("missions_per_sec",), True),
+    (("latency_ms", "p50"), False),
+    (("latency_ms", "p95"), False),
+    (("latency_ms", "p99"), False),
+    (("messages_per_mission",), False),
+]
+# Rates are compared by absolute increase, since their baseline is usually 0.
+RATE_METRICS = ("failure_rate", "timeout_rate")
+
+
+def config_mismatches(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    keys = sorted(set(current) | set(baseline))
+    return [
+        f"{key}: {baseline.get(key)!r} -> {current.get(key)!r}"
+        for key in keys
+        if current.get(key) != baseline.get(key)
+    ]
+
+
+def compare_to_baseline(
+    current: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    max_regression: float,
+    max_rate_increase: float,
+) -> list[str]:
+    regressions: list[str] = []
+    baseline_by_bus = {entry["bus"]: entry for entry in baseline}
+    for entry in current:
+        previous = baseline_by_bus.get(entry["bus"])
+        if previous is None:
+            continue
+        for rate in RATE_METRICS:
+            if entry[rate] - previous.get(rate, 0.0) > max_rate_increase:
+                regressions.append(f"{entry['bus']}: {rate} {previous.get(rate, 0.0)} -> {entry[rate]}")
+        for path, higher_is_better in REGRESSION_METRICS:
+            now: Any = entry
+            before: Any = previous
+            for key in path:
+                now, before = now[key], before[key]
+            if before == 0:
+                continue
+            change = (now - before) / before
+            if (-change if higher_is_better else change) > max_regression:
+                regressions.append(
+                    f"{entry['bus']}: {'.'.join(path)} {before} -> {now} ({change:+.1%})"
+                )
+    return regressions
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bus", action="append", choices=BUS_KINDS, help="Repeatable. Default: memory and fakeredis.")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--missions", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=20, help="Maximum missions in flight.")
+    parser.add_argument("--agent-concurrency", type=int, default=1, help="Handlers in flight per agent.")
+    parser.add_argument("--mission-timeout", type=float, default=30.0)
+    parser.add_argument("--llm-latency", type=LatencyDistribution.parse, default="lognormal:0.02:0.5")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--search-latency", type=LatencyDistribution.parse, default="lognormal:0.05:0.5")
+    parser.add_argument("--search-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write machine-readable JSON results to this path.")
+    parser.add_argument("--baseline", help="JSON results from a previous run to compare against.")
+    parser.add_argument("--max-regression", type=float, default=0.10, help="Allowed relative regression.")
+    parser.add_argument(
+        "--max-rate-increase",
+        type=float,
+        default=0.01,
+        help="Allowed absolute increase of the failure and timeout rates.",
+    )
+    parser.add_argument("--log-level", default="CRITICAL")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper())
+    config = BenchmarkConfig(
+        missions=args.missions,
+        warmup=args.warmup,
+        concurrency=args.concurrency,
+        agent_concurrency=args.agent_concurrency,
+        mission_timeout=args.mission_timeout,
+        llm_latency=args.llm_latency,
+        llm_error_rate=args.llm_error_rate,
+        search_latency=args.search_latency,
+        search_error_rate=args.search_error_rate,
+        seed=args.seed,
+        redis_url=args.redis_url,
+    )
+    report_config = {
+        **{key: value for key, value in asdict(config).items() if key != "redis_url"},
+        "llm_latency": str(config.llm_latency),
+        "search_latency": str(config.search_latency),
+    }
+    baseline: dict[str, Any] | None = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        mismatches = config_mismatches(report_config, baseline["config"])
+        if mismatches:
+            print("Baseline was recorded with a different configuration:", file=sys.stderr)
+            for mismatch in mismatches:
+                print(f"  {mismatch}", file=sys.stderr)
+            return 2
+    results = [asdict(asyncio.run(run_benchmark(bus, config))) for bus in args.bus or ["memory", "fakeredis"]]
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": report_config,
+        "results": results,
+    }
+    for entry in results:
+        latency = entry["latency_ms"]
+        print(
+            f"{entry['bus']:>10}: {entry['missions_per_sec']:.2f} missions/s "
+            f"p50={latency['p50']:.1f}ms p95={latency['p95']:.1f}ms p99={latency['p99']:.1f}ms "
+            f"ok={entry['succeeded']} failed={entry['failed']} timeout={entry['timed_out']} "
+            f"msgs/mission={entry['messages_per_mission']:.2f} "
+            f"rss_growth={entry['memory']['rss_growth_bytes'] / 1024:.0f}KiB"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    if baseline is not None:
+        regressions = compare_to_baseline(
+            results,
+            baseline["results"],
+            args.max_regression,
+            args.max_rate_increase,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+from app.agents.researcher import ResearcherAgent
+from app.agents.supervisor import RESEARCHER_TASKS_CHANNEL, TASK_RESULTS_CHANNEL, SupervisorAgent
+from app.core.blackboard import InMemoryBlackboard
+from app.core.event_bus import InMemoryEventBus
+from app.domain.models import SwarmControlAction, SwarmMessage, SwarmMessageType, Task, TaskStatus
+from benchmarks.fakes import FakeLLMClient, FakeSearchClient, LatencyDistribution
+
+
+def _researcher(event_bus: InMemoryEventBus, latency: str = "constant:0") -> ResearcherAgent:
+    distribution = LatencyDistribution.parse(latency)
+    return ResearcherAgent(
+        agent_id="researcher-test",
+        event_bus=event_bus,
+        llm_client=FakeLLMClient(distribution, 0.0, seed=0),
+        search_client=FakeSearchClient(distribution, 0.0, seed=1),
+        concurrency=1,
+    )
+
+
+def _task_message(mission_id: uuid.UUID) -> SwarmMessage:
+    task = Task(mission_id=mission_id, kind="research", payload={"goal": "g"}, assigned_agent="researcher")
+    return SwarmMessage(
+        mission_id=mission_id,
+        task_id=task.id,
+        channel=RESEARCHER_TASKS_CHANNEL,
+        type=SwarmMessageType.TASK_CREATED,
+        payload={"task": task.model_dump(mode="json")},
+    )
+
+
+def _cancel_message(mission_id: uuid.UUID, channel: str) -> SwarmMessage:
+    return SwarmMessage(
+        mission_id=mission_id,
+        channel=channel,
+        type=SwarmMessageType.CONTROL,
+        payload={"action": SwarmControlAction.CANCEL},
+    )
+
+
+async def _collect(event_bus: InMemoryEventBus, channel: str, results: list[SwarmMessage]) -> None:
+    async for message in event_bus.subscribe(channel):
+        results.append(message)
+
+
+async def _wait_for_subscribers(event_bus: InMemoryEventBus, *channels: str) -> None:
+    while not all([await event_bus.subscriber_count(channel) for channel in channels]):
+        await asyncio.sleep(0)
+
+
+def test_cancel_before_handler_starts_releases_slot() -> None:
+    async def scenario() -> None:
+        event_bus = InMemoryEventBus()
+        researcher = _researcher(event_bus)
+        results: list[SwarmMessage] = []
+        collector = asyncio.create_task(_collect(event_bus, TASK_RESULTS_CHANNEL, results))
+        runner = asyncio.create_task(researcher.run())
+        await _wait_for_subscribers(event_bus, RESEARCHER_TASKS_CHANNEL, TASK_RESULTS_CHANNEL)
+
+        # Vary the number of loop iterations between the task and its cancel so that one of
+        # them lands after the handler task is created but before its first step.
+        for yields in range(6):
+            cancelled_mission = uuid.uuid4()
+            await event_bus.publish(RESEARCHER_TASKS_CHANNEL, _task_message(cancelled_mission))
+            for _ in range(yields):
+                await asyncio.sleep(0)
+            await event_bus.publish(RESEARCHER_TASKS_CHANNEL, _cancel_message(cancelled_mission, RESEARCHER_TASKS_CHANNEL))
+            await asyncio.sleep(0.01)
+        live_mission = uuid.uuid4()
+        await event_bus.publish(RESEARCHER_TASKS_CHANNEL, _task_message(live_mission))
+
+        async with asyncio.timeout(2):
+            while live_mission not in [message.mission_id for message in results]:
+                await asyncio.sleep(0.01)
+
+        await researcher.drain(timeout=1)
+        runner.cancel()
+        collector.cancel()
+        await asyncio.gather(runner, collector, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_drain_finishes_queued_messages() -> None:
+    async def scenario() -> None:
+        event_bus = InMemoryEventBus()
+        researcher = _researcher(event_bus, latency="constant:0.05")
+        results: list[SwarmMessage] = []
+        collector = asyncio.create_task(_collect(event_bus, TASK_RESULTS_CHANNEL, results))
+        runner = asyncio.create_task(researcher.run())
+        await _wait_for_subscribers(event_bus, RESEARCHER_TASKS_CHANNEL, TASK_RESULTS_CHANNEL)
+
+        # With concurrency 1 the first task is in flight and the second waits in the local queue.
+        for _ in range(2):
+            await event_bus.publish(RESEARCHER_TASKS_CHANNEL, _task_message(uuid.uuid4()))
+        await asyncio.sleep(0.01)
+        await researcher.drain(timeout=5)
+        await asyncio.sleep(0)
+
+        assert len(results) == 2
+        runner.cancel()
+        collector.cancel()
+        await asyncio.gather(runner, collector, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_cancel_after_completion_leaves_mission_untouched() -> None:
+    async def scenario() -> None:
+        event_bus = InMemoryEventBus()
+        blackboard = InMemoryBlackboard()
+        supervisor = SupervisorAgent(
+            agent_id="supervisor-test",
+            event_bus=event_bus,
+            llm_client=FakeLLMClient(LatencyDistribution.parse("constant:0"), 0.0, seed=0),
+            blackboard=blackboard,
+        )
+        mission_id = uuid.uuid4()
+        root = Task(mission_id=mission_id, kind="mission_root", payload={})
+        child = Task(
+            mission_id=mission_id,
+            parent_id=root.id,
+            kind="research",
+            payload={},
+            status=TaskStatus.COMPLETED,
+            assigned_agent="researcher",
+        )
+        await blackboard.create_task(root)
+        await blackboard.create_task(child)
+        forwarded: list[SwarmMessage] = []
+        collector = asyncio.create_task(_collect(event_bus, RESEARCHER_TASKS_CHANNEL, forwarded))
+        await _wait_for_subscribers(event_bus, RESEARCHER_TASKS_CHANNEL)
+
+        await supervisor.cancel_mission(_cancel_message(mission_id, RESEARCHER_TASKS_CHANNEL))
+        await asyncio.sleep(0)
+
+        assert root.status == TaskStatus.PENDING
+        assert child.status == TaskStatus.COMPLETED
+        assert forwarded == []
+        collector.cancel()
+        await asyncio.gather(collector, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_run_cancels_in_flight_handlers() -> None:
+    async def scenario() -> None:
+        event_bus = InMemoryEventBus()
+        researcher = _researcher(event_bus, latency="constant:0.05")
+        runner = asyncio.create_task(researcher.run())
+        await _wait_for_subscribers(event_bus, RESEARCHER_TASKS_CHANNEL)
+
+        await event_bus.publish(RESEARCHER_TASKS_CHANNEL, _task_message(uuid.uuid4()))
+        async with asyncio.timeout(2):
+            while not researcher._in_flight:
+                await asyncio.sleep(0)
+        in_flight = set(researcher._in_flight)
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+        assert all(task.done() for task in in_flight)
+        assert not researcher._in_flight
+
+    asyncio.run(scenario())
+
+
+def test_cancel_reaches_listener_behind_queued_messages() -> None:
+    async def scenario() -> None:
+        event_bus = InMemoryEventBus()
+        researcher = _researcher(event_bus, latency="constant:0.05")
+        results: list[SwarmMessage] = []
+        collector = asyncio.create_task(_collect(event_bus, TASK_RESULTS_CHANNEL, results))
+        runner = asyncio.create_task(researcher.run())
+        await _wait_for_subscribers(event_bus, RESEARCHER_TASKS_CHANNEL, TASK_RESULTS_CHANNEL)
+
+        # With concurrency 1 the first mission is in flight and the others wait, so the
+        # cancel arrives behind more messages than the agent has slots for.
+        missions = [uuid.uuid4() for _ in range(4)]
+        for mission_id in missions:
+            await event_bus.publish(RESEARCHER_TASKS_CHANNEL, _task_message(mission_id))
+        await event_bus.publish(RESEARCHER_TASKS_CHANNEL, _cancel_message(missions[0], RESEARCHER_TASKS_CHANNEL))
+        async with asyncio.timeout(2):
+            while len(results) < len(missions) - 1:
+                await asyncio.sleep(0.01)
+        await researcher.drain(timeout=1)
+        await asyncio.sleep(0)
+
+        assert sorted(message.mission_id for message in results) == sorted(missions[1:])
+        runner.cancel()
+        collector.cancel()
+        await asyncio.gather(runner, collector, return_exceptions=True)
+
+    asyncio.run(scenario())
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from benchmarks.fakes import LatencyDistribution
+from benchmarks.run import _percentile, compare_to_baseline, config_mismatches
+
+
+def _entry(**overrides: Any) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "bus": "memory",
+        "missions_per_sec": 100.0,
+        "latency_ms": {"p50": 10.0, "p95": 20.0, "p99": 30.0},
+        "messages_per_mission": 6.0,
+        "failure_rate": 0.0,
+        "timeout_rate": 0.0,
+    }
+    entry.update(overrides)
+    return entry
+
+
+@pytest.mark.parametrize(
+    ("values", "pct", "expected"),
+    [
+        (list(range(1, 11)), 50, 5),
+        (list(range(1, 11)), 90, 9),
+        (list(range(1, 11)), 100, 10),
+        (list(range(1, 501)), 95, 475),
+        (list(range(1, 501)), 99, 495),
+        ([7.0], 50, 7.0),
+        ([7.0], 99, 7.0),
+        ([], 50, 0.0),
+    ],
+)
+def test_percentile_nearest_rank(values: list[float], pct: float, expected: float) -> None:
+    assert _percentile(values, pct) == expected
+
+
+def test_compare_to_baseline_within_threshold() -> None:
+    current = [_entry(missions_per_sec=95.0, latency_ms={"p50": 10.5, "p95": 21.0, "p99": 31.0})]
+    assert compare_to_baseline(current, [_entry()], max_regression=0.1, max_rate_increase=0.01) == []
+
+
+def test_compare_to_baseline_flags_regressions() -> None:
+    current = [_entry(missions_per_sec=80.0, latency_ms={"p50": 10.0, "p95": 25.0, "p99": 30.0})]
+    regressions = compare_to_baseline(current, [_entry()], max_regression=0.1, max_rate_increase=0.01)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("memory: missions_per_sec")
+    assert regressions[1].startswith("memory: latency_ms.p95")
+
+
+def test_compare_to_baseline_flags_rate_increase() -> None:
+    current = [_entry(failure_rate=0.2)]
+    regressions = compare_to_baseline(current, [_entry()], max_regression=0.1, max_rate_increase=0.01)
+    assert regressions == ["memory: failure_rate 0.0 -> 0.2"]
+
+
+def test_compare_to_baseline_skips_buses_missing_from_baseline() -> None:
+    current = [_entry(bus="fakeredis", missions_per_sec=1.0)]
+    assert compare_to_baseline(current, [_entry()], max_regression=0.1, max_rate_increase=0.01) == []
+
+
+def test_config_mismatches() -> None:
+    config = {"missions": 200, "llm_latency": "lognormal:0.02:0.5"}
+    assert config_mismatches(config, dict(config)) == []
+    assert config_mismatches({**config, "missions": 500}, config) == ["missions: 200 -> 500"]
+    assert config_mismatches({**config, "seed": 1}, config) == ["seed: None -> 1"]
+
+
+@pytest.mark.parametrize(
+    ("spec", "kind", "params"),
+    [
+        ("constant:0", "constant", (0.0,)),
+        ("uniform:0.01:0.05", "uniform", (0.01, 0.05)),
+        ("normal:0.1:0.02", "normal", (0.1, 0.02)),
+        ("lognormal:0.02:0.5", "lognormal", (0.02, 0.5)),
+        ("exponential:0.05", "exponential", (0.05,)),
+    ],
+)
+def test_latency_distribution_parse(spec: str, kind: str, params: tuple[float, ...]) -> None:
+    distribution = LatencyDistribution.parse(spec)
+    assert (distribution.kind, distribution.params) == (kind, params)
+    assert str(distribution) == spec
+
+
+@pytest.mark.parametrize("spec", ["gamma:1:2", "constant", "uniform:0.1", "normal:0.1:0.2:0.3", "constant:fast"])
+def test_latency_distribution_parse_rejects_invalid_specs(spec: str) -> None:
+    with pytest.raises(ValueError):
+        LatencyDistribution.parse(spec)
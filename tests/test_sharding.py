@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from app.core.sharding import ShardLayout
+
+
+def test_parse_counts_and_routes_by_mission_id() -> None:
+    layout = ShardLayout.parse(" supervisor = 2, researcher=3 ")
+    assert layout.counts == {"supervisor": 2, "researcher": 3}
+    assert layout.count("coder") == 1
+    mission_id = uuid.UUID(int=7)
+    assert layout.channel_for("swarm:supervisor:control", "supervisor", mission_id) == "swarm:supervisor:control:1"
+    assert layout.channel_for("swarm:workers:coder:tasks", "coder", mission_id) == "swarm:workers:coder:tasks"
+
+
+def test_parse_empty_spec_keeps_plain_channels() -> None:
+    assert ShardLayout.parse("").counts == {}
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "reseacher=2",
+        "supervisor=two",
+        "supervisor=0",
+        "supervisor=-1",
+        "supervisor",
+        "=2",
+    ],
+)
+def test_parse_rejects_invalid_entries(spec: str) -> None:
+    with pytest.raises(ValueError):
+        ShardLayout.parse(spec)
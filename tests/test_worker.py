@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from app.worker import _parse_concurrency
+
+
+ROLES = ["supervisor", "researcher"]
+
+
+@pytest.mark.parametrize("spec", ["researcher=8,4", "4,researcher=8"])
+def test_parse_concurrency_applies_overrides_after_default(spec: str) -> None:
+    assert _parse_concurrency(spec, ROLES) == {"supervisor": 4, "researcher": 8}
+
+
+def test_parse_concurrency_defaults_to_one() -> None:
+    assert _parse_concurrency("", ROLES) == {"supervisor": 1, "researcher": 1}
+
+
+def test_parse_concurrency_ignores_roles_not_started() -> None:
+    assert _parse_concurrency("researcher=8", ["supervisor"]) == {"supervisor": 1}
+
+
+@pytest.mark.parametrize("spec", ["reseacher=8", "researcher=0", "researcher=many", "0"])
+def test_parse_concurrency_rejects_invalid_entries(spec: str) -> None:
+    with pytest.raises(ValueError):
+        _parse_concurrency(spec, ROLES)